@@ -1,9 +1,9 @@
 import sys
 import os
 import re # For regular expressions in syntax highlighter
-import subprocess # For opening files/folders cross-platform
-import pathlib # For path manipulation in cross-platform folder opening
-import hashlib # For auto-save path generation
+import uuid # For stable per-tab auto-save names
+import html # For escaping plain text written as HTML
+from functools import lru_cache, partial # For sharing parsed colors and formats; for signal slots
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QTextEdit, QFileDialog, QTabWidget,
@@ -12,25 +12,113 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import (
     QAction, QIcon, QTextCharFormat, QColor, QPalette,
-    QSyntaxHighlighter, QTextCursor, QFont, QTextDocument, QKeySequence
+    QSyntaxHighlighter, QTextCursor, QFont, QKeySequence, QTextFormat
+)
+from PySide6.QtCore import (
+    Qt, QTimer, QSize, QSaveFile, QRegularExpression, QPoint,
+    QObject, QRunnable, QThreadPool, Signal, QTextStream, QStringConverter, QSignalBlocker
 )
-from PySide6.QtCore import Qt, QTimer, QSize, QSaveFile, QRegularExpression, QFileInfo
 
-# Helper function to load icons from the local 'icons' directory with fallback
+REHIGHLIGHT_CHUNK_SIZE = 200 # Blocks re-highlighted per idle-time slice after a theme change
+
+# Adaptive auto-save interval (ms): short while notes are being edited, backing off while idle
+AUTO_SAVE_ACTIVE_INTERVAL = 30000
+AUTO_SAVE_MAX_INTERVAL = 180000
+
+# Block properties Qt's HTML import sets on unformatted paragraphs: left-to-right from the <html> element,
+# zero margins and indents from toHtml() output. A block holding only these values is not formatted.
+PLAIN_BLOCK_PROPERTIES = {
+    QTextFormat.Property.LayoutDirection.value: Qt.LayoutDirection.LeftToRight.value,
+    QTextFormat.Property.BlockTopMargin.value: 0,
+    QTextFormat.Property.BlockBottomMargin.value: 0,
+    QTextFormat.Property.BlockLeftMargin.value: 0,
+    QTextFormat.Property.BlockRightMargin.value: 0,
+    QTextFormat.Property.TextIndent.value: 0,
+    QTextFormat.Property.BlockIndent.value: 0,
+}
+
+# Font weights used by the formatting slots, resolved once at import
+FONT_WEIGHT_BOLD = QFont.Weight.Bold
+FONT_WEIGHT_NORMAL = QFont.Weight.Normal
+
+# Stylesheets are built once at import; apply_theme only hands them to Qt when the theme changes
+DARK_QSS = """
+QMainWindow { background-color: #282c34; }
+QMenuBar { background-color: #21252b; color: #abb2bf; }
+QMenuBar::item:selected { background-color: #3e4452; }
+QMenu { background-color: #21252b; color: #abb2bf; border: 1px solid #3e4452; }
+QMenu::item:selected { background-color: #3e4452; }
+QToolBar { background-color: #21252b; border-bottom: 1px solid #3e4452; }
+QStatusBar { background-color: #21252b; color: #abb2bf; border-top: 1px solid #3e4452; }
+QTabWidget::pane { border: 1px solid #3e4452; }
+QTabBar::tab { background: #3e4452; color: #abb2bf; border: 1px solid #3e4452; border-bottom-color: #282c34; border-radius: 5px 5px 0 0; padding: 5px; margin: 2px;}
+QTabBar::tab:selected { background: #282c34; border-bottom-color: #282c34; }
+QTextEdit { background-color: #21252b; color: #abb2bf; border: 1px solid #3e4452; border-radius: 8px; padding: 5px; }
+"""
+LIGHT_TABS_QSS = "QTabWidget::pane { border: 0; } QTabBar::tab { border-radius: 5px 5px 0 0; padding: 5px; margin: 2px;} QTabBar::tab:selected { background: #e0e0e0; }" # Also NoteTabWidget's default
+
+# Parsed colors and highlight formats are cached and shared by every highlighter instance
+@lru_cache(maxsize=128)
+def _color(hex_color):
+    return QColor(hex_color)
+
+@lru_cache(maxsize=128)
+def _fmt(hex_color, bold=False):
+    fmt = QTextCharFormat()
+    fmt.setForeground(_color(hex_color))
+    if bold:
+        fmt.setFontWeight(QFont.Bold)
+    return fmt
+
+# Application palettes for apply_theme, each assembled once and reused on every theme switch
+@lru_cache(maxsize=None)
+def _dark_palette():
+    # Dark mode palette (Dracula-like)
+    palette = QPalette()
+    palette.setColor(QPalette.Window, _color("#282c34")) # Background
+    palette.setColor(QPalette.WindowText, _color("#abb2bf")) # General Text
+    palette.setColor(QPalette.Base, _color("#21252b")) # TextEdit background
+    palette.setColor(QPalette.AlternateBase, _color("#3e4452"))
+    palette.setColor(QPalette.ToolTipBase, _color("#282c34"))
+    palette.setColor(QPalette.ToolTipText, _color("#abb2bf"))
+    palette.setColor(QPalette.Text, _color("#abb2bf")) # Foreground
+    palette.setColor(QPalette.Button, _color("#3e4452")) # Button background
+    palette.setColor(QPalette.ButtonText, _color("#abb2bf")) # Button text
+    palette.setColor(QPalette.BrightText, Qt.red)
+    palette.setColor(QPalette.Link, _color("#61afef")) # Link color
+    palette.setColor(QPalette.Highlight, _color("#61afef")) # Selection highlight
+    palette.setColor(QPalette.HighlightedText, _color("#282c34")) # Selected text color
+    return palette
+
+@lru_cache(maxsize=None)
+def _light_palette():
+    # Light mode palette (the style's default system palette)
+    return QApplication.instance().style().standardPalette()
+
+# Editor font shared by every TextEditor. Built on first use, since a QFont
+# cannot be created before the QApplication exists.
+@lru_cache(maxsize=None)
+def _editor_font():
+    return QFont("Inter", 12)
+
+# Helper function to load icons from the local 'icons' directory with fallback.
+# Cached per name: QIcon is implicitly shared, so menus and toolbars can reuse one instance.
+@lru_cache(maxsize=None)
 def get_icon(name):
     path = os.path.join("icons", f"{name}.svg")
-    # First, try to load from the local path
-    if os.path.exists(path):
-        return QIcon(path)
-    # As a fallback, try to get a themed icon (e.g., from system icon theme)
-    pm = QIcon.fromTheme(name)
-    if not pm.isNull():
-        return pm
-    # Last resort: return an empty icon if neither is found
-    return QIcon()
+    # First, try to load from the local path (QIcon is null if the file is missing; no separate stat)
+    icon = QIcon(path)
+    if icon.isNull():
+        # As a fallback, try to get a themed icon (e.g., from system icon theme).
+        # If the theme lacks it too, this is an empty icon.
+        icon = QIcon.fromTheme(name)
+    return icon
 
 # Function to reveal a file or folder in the native file manager
 def reveal_in_file_manager(path):
+    # Imported on first use (right-click only) to keep them off the startup path
+    import subprocess # For opening files/folders cross-platform
+    import pathlib # For path manipulation in cross-platform folder opening
     p = pathlib.Path(path)
     if not p.exists():
         print(f"Path does not exist: {path}") # For debugging
@@ -43,63 +131,213 @@ def reveal_in_file_manager(path):
         # xdg-open is a common standard on Linux for opening files/folders
         subprocess.Popen(["xdg-open", str(p)])
 
+# Function to persist directory entries (new or replaced files) with a single fsync
+def fsync_directory(path):
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return # Directories can't be opened this way on Windows; NTFS metadata is journaled anyway
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        print(f"Could not sync directory {path}: {e}") # For debugging
+    finally:
+        os.close(fd)
+
+# Function to build minimal HTML for a document without formatting: one paragraph per line,
+# whitespace preserved, readable by both browsers and QTextEdit.setHtml
+def plain_text_to_html(text):
+    paragraphs = "\n".join(
+        f'<p style="margin:0; white-space:pre-wrap;">{line}</p>' if line
+        else '<p style="-qt-paragraph-type:empty; margin:0;"><br /></p>'
+        for line in html.escape(text, quote=False).split("\n")
+    )
+    # No newline after </html>: setHtml would turn it into a trailing space on the last line
+    return f'<!DOCTYPE html>\n<html><head><meta charset="utf-8" /></head><body>\n{paragraphs}\n</body></html>'
+
+# Function to read one auto-saved file; returns (content, is_html, error) so a bad file doesn't stop the others
+def read_auto_save_file(path):
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(4096)
+            # Rich-text heuristic on the raw head only: toHtml() output opens with both tags
+            head_lower = head.lower()
+            is_html = b"<html" in head_lower and b"<body" in head_lower
+            return (head + f.read()).decode('utf-8'), is_html, None
+    except Exception as e:
+        return None, False, e
+
+# Function to delete auto-save files; a file that was never written is not an error
+def remove_auto_save_files(temp_file_paths):
+    for temp_file_path in temp_file_paths:
+        try:
+            os.remove(temp_file_path)
+            print(f"Cleaned up auto-save file: {temp_file_path}")
+        except FileNotFoundError:
+            pass # Never auto-saved
+        except Exception as e:
+            print(f"Error cleaning up auto-save file '{temp_file_path}': {e}")
+
+class AutoSaveSignals(QObject):
+    """Signals emitted by AutoSaveJob; delivered to the GUI thread as queued calls."""
+    # Display name of the note that was auto-saved, and the snapshot's record from auto_save_all_tabs
+    saved = Signal(str, object)
+
+# Background job that writes auto-save snapshots, keeping disk I/O off the GUI thread
+class AutoSaveJob(QRunnable):
+    def __init__(self, auto_save_dir, snapshots, signals):
+        super().__init__()
+        self.auto_save_dir = auto_save_dir
+        # List of (temp_file_path, display_name, text, record, old_file_paths) taken on the GUI thread;
+        # old_file_paths are earlier auto-saves of the same note under other names
+        self.snapshots = snapshots
+        self.signals = signals
+
+    def run(self):
+        os.makedirs(self.auto_save_dir, exist_ok=True)
+        for temp_file_path, display_name, text, record, old_file_paths in self.snapshots:
+            try:
+                # QSaveFile (as in MainWindow.save_file) writes a temporary file, syncs it and renames
+                # it over the old auto-save on commit(): a crash mid-write never leaves a truncated file.
+                save_file_obj = QSaveFile(temp_file_path)
+                if not save_file_obj.open(QSaveFile.WriteOnly):
+                    raise OSError(save_file_obj.errorString())
+                save_file_obj.write(text.encode('utf-8')) # Encoded once, written as a single binary block
+                if not save_file_obj.commit():
+                    raise OSError(save_file_obj.errorString())
+            except Exception as e:
+                print(f"Error auto-saving '{display_name}': {e}")
+                continue
+            remove_auto_save_files(old_file_paths) # Superseded, now that the new copy is safe
+            try:
+                self.signals.saved.emit(display_name, record) # Only reported once the file is committed
+            except RuntimeError:
+                pass # The window was closed while this job ran; the file is committed all the same
+        fsync_directory(self.auto_save_dir) # Persists the entries of every file written above
+
+# Background job that deletes auto-save files once their notes are really saved. It runs on the same
+# single-thread pool as AutoSaveJob, so it is ordered after any write still queued for those files.
+class RemoveAutoSaveJob(QRunnable):
+    def __init__(self, temp_file_paths):
+        super().__init__()
+        self.temp_file_paths = temp_file_paths
+
+    def run(self):
+        remove_auto_save_files(self.temp_file_paths)
+
 # Define a simple syntax highlighter for Python, now theme-aware and using QRegularExpression
 class PythonHighlighter(QSyntaxHighlighter):
+    KEYWORDS = [
+        "False", "None", "True", "and", "as", "assert", "async", "await",
+        "break", "class", "continue", "def", "del", "elif", "else",
+        "except", "finally", "for", "from", "global", "if", "import",
+        "in", "is", "lambda", "nonlocal", "not", "or", "pass", "raise",
+        "return", "try", "while", "with", "yield"
+    ]
+    # Comments, strings, keywords and function names are alternatives of one pattern, so each
+    # block is scanned once. The leftmost match wins, which keeps keywords inside strings and
+    # comments (and '#' inside strings) from being re-colored.
+    # Possessive quantifiers (*+, ++) never give characters back, so an unterminated string or
+    # a long identifier not followed by '(' fails in one linear step instead of backtracking.
+    # Compiled once at import and shared by every instance; only the formats depend on the theme.
+    HIGHLIGHT_REGEX = QRegularExpression(
+        r"(?<cmt>#.*)"
+        r'|(?<str>"[^"\n]*+"|\'[^\'\n]*+\')'
+        r"|(?<kw>\b(?:" + "|".join(KEYWORDS) + r")\b)"
+        r"|(?<fn>\b[A-Za-z_][A-Za-z0-9_]++(?=\())"
+    )
+    HIGHLIGHT_REGEX.optimize() # JIT-compile now instead of on the first highlighted block
+    GROUP_FORMATS = {} # dark_mode -> {group name: format}, filled by formats_for()
+
     def __init__(self, document, dark_mode=False):
         super().__init__(document)
-        self.dark_mode = dark_mode
-        self.highlighting_rules = []
-
-        # Keyword format (colors adjusted for light/dark mode)
-        keyword_color = QColor("#569CD6") if self.dark_mode else QColor("#0000FF")
-        keyword_format = QTextCharFormat()
-        keyword_format.setForeground(keyword_color)
-        keyword_format.setFontWeight(QFont.Bold)
-        keywords = [
-            "False", "None", "True", "and", "as", "assert", "async", "await",
-            "break", "class", "continue", "def", "del", "elif", "else",
-            "except", "finally", "for", "from", "global", "if", "import",
-            "in", "is", "lambda", "nonlocal", "not", "or", "pass", "raise",
-            "return", "try", "while", "with", "yield"
-        ]
-        # Use QRegularExpression for efficient pattern matching
-        self.highlighting_rules.extend([(QRegularExpression(r"\b%s\b" % w), keyword_format) for w in keywords])
-
-        # String format (colors adjusted for light/dark mode)
-        string_color = QColor("#CE9178") if self.dark_mode else QColor("#A31515")
-        string_format = QTextCharFormat()
-        string_format.setForeground(string_color)
-        self.highlighting_rules.append((QRegularExpression(r'"[^"\n]*"|\'[^\'\n]*\''), string_format))
-
-        # Comment format (colors adjusted for light/dark mode)
-        comment_color = QColor("#6A9955") if self.dark_mode else QColor("#008000")
-        comment_format = QTextCharFormat()
-        comment_format.setForeground(comment_color)
-        self.highlighting_rules.append((QRegularExpression(r"#.*"), comment_format))
-
-        # Function format (colors adjusted for light/dark mode)
-        function_color = QColor("#C586C0") if self.dark_mode else QColor("#800080")
-        function_format = QTextCharFormat()
-        function_format.setForeground(function_color)
-        self.highlighting_rules.append((QRegularExpression(r"\b[A-Za-z_][A-Za-z0-9_]+(?=\()"), function_format))
+        self.set_dark_mode(dark_mode)
+
+    def set_dark_mode(self, enabled):
+        """Switches the formats to the given theme, keeping this highlighter instance."""
+        self.dark_mode = enabled
+        self.group_formats = self.formats_for(enabled)
+
+    @classmethod
+    def formats_for(cls, dark_mode):
+        """Returns the per-group formats for a theme, built on first use and shared by all instances."""
+        formats = cls.GROUP_FORMATS.get(dark_mode)
+        if formats is None:
+            # Colors adjusted for light/dark mode
+            formats = cls.GROUP_FORMATS[dark_mode] = {
+                "cmt": _fmt("#6A9955" if dark_mode else "#008000"),
+                "str": _fmt("#CE9178" if dark_mode else "#A31515"),
+                "kw": _fmt("#569CD6" if dark_mode else "#0000FF", bold=True),
+                "fn": _fmt("#C586C0" if dark_mode else "#800080"),
+            }
+        return formats
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def scan_line(text):
+        """
+        Returns the (start, length, group) spans to highlight in one line of text.
+        Cached by line content: repeated lines (imports, 'pass', 'return', ...) skip the regex entirely.
+        """
+        spans = []
+        it = PythonHighlighter.HIGHLIGHT_REGEX.globalMatch(text)
+        while it.hasNext():
+            match = it.next()
+            # Exactly one named group takes part in each match; it selects the format
+            for group in ("cmt", "str", "kw", "fn"):
+                start = match.capturedStart(group)
+                if start >= 0:
+                    length = match.capturedLength(group)
+                    # Matches come in order; merge touching spans of the same kind into one setFormat call
+                    if spans and spans[-1][2] == group and spans[-1][0] + spans[-1][1] == start:
+                        prev_start, prev_length, _ = spans[-1]
+                        spans[-1] = (prev_start, prev_length + length, group)
+                    else:
+                        spans.append((start, length, group))
+                    break
+        return tuple(spans)
 
     def highlightBlock(self, text):
-        for pattern_regex, format in self.highlighting_rules:
-            it = pattern_regex.globalMatch(text)
-            while it.hasNext():
-                match = it.next()
-                self.setFormat(match.capturedStart(), match.capturedLength(), format)
+        # Blank and whitespace-only lines have nothing to highlight
+        if not text or text.isspace():
+            self.setCurrentBlockState(0)
+            return
+        for start, length, group in self.scan_line(text):
+            self.setFormat(start, length, self.group_formats[group])
         self.setCurrentBlockState(0)
 
+# Highlighter class per lower-case file extension, used by TextEditor.set_syntax_highlighter.
+# Add entries here for other language highlighters (e.g., ".cpp": CppHighlighter, ".js": JavaScriptHighlighter)
+HIGHLIGHTERS = {
+    ".py": PythonHighlighter,
+}
+
 class TextEditor(QTextEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setFont(QFont("Inter", 12)) # Use Inter font
+        self.setFont(_editor_font()) # Use Inter font (one shared QFont, resolved once)
         self.document().setModified(False) # Set initial modified state to false
         self.highlighter = None # Will be set based on file type
-        self.current_file_path = None
+        self.pending_highlighter_file = None # File whose highlighter is attached once the tab is shown
+        self.current_file_path = None # Also sets file_ext, is_html_file and auto_save_path
         self.is_dark_mode = False
         self.rich_mode = False # New: Flag to indicate if content has rich text formatting
+        self.auto_save_id = uuid.uuid4().hex # Stable auto-save name while the tab is untitled
+        self.tab_modified_marker = None # Modified state currently shown by the '*' in the tab title
+        self.tab_title = "Untitled" # Tab title without the '*' marker
+        self.formatting_cache = None # Result of has_formatting(), cleared whenever the document changes
+        self.document().contentsChange.connect(self.clear_formatting_cache)
+        self.auto_save_targets = set() # Auto-save files written for this editor since its last real save
+        self.last_auto_save_hash = None # Hash of the text in the last successful auto-save
+        self.last_auto_save_revision = None # document().revision() of that text
+        self.auto_save_generation = 0 # Bumped by a real save; older in-flight auto-saves are then ignored
+
+        # Background re-highlighting of off-screen blocks (see rehighlight_visible)
+        self._rehighlight_cursor = None
+        self._rehighlight_timer = QTimer(self)
+        self._rehighlight_timer.setSingleShot(True)
+        self._rehighlight_timer.setInterval(0)
+        self._rehighlight_timer.timeout.connect(self._rehighlight_next_chunk)
 
         # Apply rounded corners via QSS
         self.setStyleSheet("QTextEdit { border-radius: 8px; padding: 5px; }")
@@ -107,25 +345,70 @@ class TextEditor(QTextEdit):
         # Context menu setup (example for custom context actions)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
+        # Custom action: Open Containing Folder (created once, reused by every context menu)
+        self.open_folder_action = QAction("Open Containing Folder", self)
+        self.open_folder_action.triggered.connect(self.open_containing_folder)
+
+    @property
+    def current_file_path(self):
+        return self._current_file_path
+
+    @current_file_path.setter
+    def current_file_path(self, path):
+        """Stores the path and caches its lower-case extension for highlighter and save decisions."""
+        self._current_file_path = path
+        self.file_ext = os.path.splitext(path)[1].lower() if path else ""
+        self.is_html_file = self.file_ext in (".html", ".htm")
+        self.auto_save_path = None # Derived from the path; recomputed by the next auto-save pass
 
     def show_context_menu(self, pos):
         menu = self.createStandardContextMenu() # Get the default text edit context menu
         menu.addSeparator()
 
-        # Custom action: Open Containing Folder
-        open_folder_action = QAction("Open Containing Folder", self)
-        if self.current_file_path:
-            folder = os.path.dirname(self.current_file_path)
-            if os.path.isdir(folder):
-                open_folder_action.triggered.connect(lambda f=folder: reveal_in_file_manager(f))
-            else:
-                open_folder_action.setEnabled(False) # Disable if path is not a directory
-        else:
-            open_folder_action.setEnabled(False) # Disable if no file is open
-        menu.addAction(open_folder_action)
+        # Disable if no file is open or its folder is not a directory
+        folder = os.path.dirname(self.current_file_path) if self.current_file_path else None
+        self.open_folder_action.setEnabled(bool(folder) and os.path.isdir(folder))
+        menu.addAction(self.open_folder_action)
 
         menu.exec(self.mapToGlobal(pos))
 
+    def open_containing_folder(self):
+        """Reveals the current file's folder; the path is read at click time."""
+        if self.current_file_path:
+            reveal_in_file_manager(os.path.dirname(self.current_file_path))
+
+
+    def clear_formatting_cache(self, *_):
+        """Slot for contentsChange: any edit may add or remove formatting."""
+        self.formatting_cache = None
+
+    def has_formatting(self):
+        """
+        Returns True if the document holds any rich formatting: character or block formats,
+        lists, tables or images. Stops at the first one found; the answer is cached until the next edit.
+        """
+        if self.formatting_cache is None:
+            self.formatting_cache = self._scan_for_formatting()
+        return self.formatting_cache
+
+    def _scan_for_formatting(self):
+        doc = self.document()
+        if doc.rootFrame().childFrames():
+            return True # Tables and other embedded frames
+        block = doc.begin()
+        while block.isValid():
+            if block.textList():
+                return True
+            for key, value in block.blockFormat().properties().items():
+                if PLAIN_BLOCK_PROPERTIES.get(key) != value: # Alignment, spacing, non-zero margins...
+                    return True
+            it = block.begin()
+            while not it.atEnd():
+                if it.fragment().charFormat().properties(): # Any explicit font, color, image, anchor...
+                    return True
+                it += 1
+            block = block.next()
+        return False
 
     def set_syntax_highlighter(self, file_path, dark_mode_enabled):
         """
@@ -133,49 +416,97 @@ class TextEditor(QTextEdit):
         For file types without a specific highlighter, it clears any active one.
         Note: .docx files are not natively supported by QTextEdit for editing or saving.
         """
-        if self.highlighter:
-            self.highlighter.setDocument(None) # Clear existing highlighter
-
-        _, ext = os.path.splitext(file_path)
-        ext = ext.lower()
+        self.pending_highlighter_file = None # An explicit call supersedes a deferred one
+        if file_path == self.current_file_path:
+            ext = self.file_ext # Cached when the path was assigned
+        else:
+            ext = os.path.splitext(file_path)[1].lower()
 
         # Syntax highlighting is typically for plain text code, not rich text HTML
-        if self.rich_mode and (ext == ".html" or ext == ".htm"):
-            self.highlighter = None # No highlighter for HTML rich text
-        elif ext == ".py":
-            # Recreate highlighter with current dark_mode setting
-            self.highlighter = PythonHighlighter(self.document(), dark_mode=dark_mode_enabled)
-        # Add more 'elif' blocks here for other language highlighters (e.g., C++, Java, JS)
-        # elif ext == ".cpp" or ext == ".h" or ext == ".hpp":
-        #     self.highlighter = CppHighlighter(self.document(), dark_mode=dark_mode_enabled)
-        # elif ext == ".js":
-        #     self.highlighter = JavaScriptHighlighter(self.document(), dark_mode=dark_mode_enabled)
+        if self.rich_mode and ext in (".html", ".htm"):
+            highlighter_class = None # No highlighter for HTML rich text
+        else:
+            # None for types without a specific highlighter (e.g., .txt, .c, .java, .html, .css)
+            highlighter_class = HIGHLIGHTERS.get(ext)
+
+        if highlighter_class and isinstance(self.highlighter, highlighter_class):
+            # Same language as before: keep the instance and only switch its colors if needed
+            if self.highlighter.dark_mode != dark_mode_enabled:
+                self.highlighter.set_dark_mode(dark_mode_enabled)
+                # Only the colors changed: visible blocks now, the rest in the background
+                self.rehighlight_visible()
         else:
-            self.highlighter = None # No specific highlighter for other types (e.g., .txt, .c, .java, .html, .css)
+            if self.highlighter:
+                self.highlighter.setDocument(None) # Clear existing highlighter
+            # A background pass in progress belonged to the old highlighter
+            self._rehighlight_timer.stop()
+            self._rehighlight_cursor = None
+            # Attaching a new highlighter to the document makes Qt queue its own full rehighlight for the
+            # next event-loop turn (rehighlightBlock would not cancel it), so no chunked pass is started here
+            self.highlighter = highlighter_class(self.document(), dark_mode=dark_mode_enabled) if highlighter_class else None
 
-        # Re-apply syntax highlighting if a highlighter is set (or was cleared)
-        if self.highlighter:
-            self.highlighter.rehighlight()
         # For plain text modes, clearing undo/redo is generally good practice if formatting changes dramatically.
         # This will also ensure any previous rich text formatting is cleared when switching to plain text mode.
         if not self.rich_mode: # Only clear for plain text modes
             self.document().clearUndoRedoStacks()
 
+    def apply_pending_highlighter(self):
+        """Attaches the highlighter deferred by NoteTabWidget.add_new_tab, if any."""
+        if self.pending_highlighter_file is not None:
+            self.set_syntax_highlighter(self.pending_highlighter_file, self.is_dark_mode)
+
 
     def set_dark_mode(self, enabled):
         """Applies dark mode styling to the text editor and updates highlighter."""
         self.is_dark_mode = enabled
         palette = self.palette()
         if enabled:
-            palette.setColor(QPalette.Base, QColor("#21252b")) # Dracula background for editor
-            palette.setColor(QPalette.Text, QColor("#abb2bf")) # Dracula foreground for editor
+            palette.setColor(QPalette.Base, _color("#21252b")) # Dracula background for editor
+            palette.setColor(QPalette.Text, _color("#abb2bf")) # Dracula foreground for editor
         else:
             palette.setColor(QPalette.Base, Qt.white)
             palette.setColor(QPalette.Text, Qt.black)
         self.setPalette(palette)
-        # Recreate and apply syntax highlighting to ensure colors update based on new theme
-        if self.current_file_path:
-            self.set_syntax_highlighter(self.current_file_path, enabled)
+        # Swap the highlighter colors in place; only the visible blocks are repainted right away
+        if self.highlighter:
+            self.highlighter.set_dark_mode(enabled)
+            self.rehighlight_visible()
+
+    def rehighlight_visible(self):
+        """
+        Re-highlights the current block and the blocks inside the viewport immediately,
+        then queues the rest of the document in small slices on the event loop.
+        Used instead of a full rehighlight() when an existing highlighter changes colors (theme changes).
+        A newly attached highlighter is highlighted in full by Qt itself; see set_syntax_highlighter.
+        """
+        if not self.highlighter or self.document().isEmpty():
+            return # Nothing to re-highlight (e.g. an empty Untitled tab after a theme switch)
+        self.highlighter.rehighlightBlock(self.textCursor().block())
+
+        viewport = self.viewport()
+        block = self.cursorForPosition(QPoint(0, 0)).block()
+        last_block = self.cursorForPosition(QPoint(viewport.width() - 1, viewport.height() - 1)).block()
+        while block.isValid():
+            self.highlighter.rehighlightBlock(block)
+            if block == last_block:
+                break
+            block = block.next()
+
+        # A QTextCursor keeps its place while the user edits, unlike a block number
+        self._rehighlight_cursor = QTextCursor(self.document())
+        self._rehighlight_timer.start()
+
+    def _rehighlight_next_chunk(self):
+        """Re-highlights the next REHIGHLIGHT_CHUNK_SIZE blocks queued by rehighlight_visible."""
+        cursor = self._rehighlight_cursor
+        if not self.highlighter or cursor is None:
+            return
+        for _ in range(REHIGHLIGHT_CHUNK_SIZE):
+            self.highlighter.rehighlightBlock(cursor.block())
+            if not cursor.movePosition(QTextCursor.NextBlock):
+                self._rehighlight_cursor = None # Reached the end of the document
+                return
+        self._rehighlight_timer.start()
 
 
 class NoteTabWidget(QTabWidget):
@@ -183,10 +514,11 @@ class NoteTabWidget(QTabWidget):
         super().__init__(parent)
         self.setTabsClosable(True)
         self.tabCloseRequested.connect(self.close_tab)
+        self.currentChanged.connect(self.on_current_changed)
         self.setMovable(True) # Allow tabs to be reordered
         self.setUsesScrollButtons(True) # Show scroll buttons if many tabs
         # Styles for light mode (dark mode QSS is handled by MainWindow)
-        self.setStyleSheet("QTabWidget::pane { border: 0; } QTabBar::tab { border-radius: 5px 5px 0 0; padding: 5px; margin: 2px;} QTabBar::tab:selected { background: #e0e0e0; }")
+        self.setStyleSheet(LIGHT_TABS_QSS)
 
     def add_new_tab(self, file_path=None, content=""):
         """Adds a new text editor tab."""
@@ -194,35 +526,50 @@ class NoteTabWidget(QTabWidget):
         editor.setText(content)
         editor.current_file_path = file_path
         # New: Initialize rich_mode for the editor
-        is_html = file_path and file_path.lower().endswith((".html", ".htm"))
-        editor.rich_mode = is_html
+        editor.rich_mode = editor.is_html_file
 
         # Pass the current dark mode status to the new editor and its highlighter
         editor.set_dark_mode(self.parent().dark_mode_enabled)
         if file_path:
-            editor.set_syntax_highlighter(file_path, self.parent().dark_mode_enabled)
-            tab_name = os.path.basename(file_path)
-        else:
-            tab_name = "Untitled"
-        index = self.addTab(editor, tab_name)
+            # The highlighter is attached when the tab is first shown (see on_current_changed)
+            editor.pending_highlighter_file = file_path
+            editor.tab_title = os.path.basename(file_path)
+        index = self.addTab(editor, editor.tab_title)
         self.setCurrentIndex(index)
         # Reliable modified marker: connect to modificationChanged
-        editor.document().modificationChanged.connect(
-            lambda modified_state, ed=editor: self.set_tab_modified(self.indexOf(ed), modified_state)
-        )
+        editor.document().modificationChanged.connect(partial(self.set_tab_modified, editor))
         # Wire up other editor signals (e.g., for status bar updates)
         self.parent().wire_editor_signals(editor)
         return editor
 
-    def set_tab_modified(self, index, modified):
-        """Adds/removes '*' to/from tab title to indicate modification."""
-        if index < 0 or index >= self.count(): return # Handle invalid index
-        base_text = self.tabText(index).rstrip("*") # Always remove '*' first
-        self.setTabText(index, base_text + ("*" if modified else ""))
+    def on_current_changed(self, index):
+        """Attaches a deferred syntax highlighter when its tab becomes current."""
+        editor = self.widget(index)
+        if editor and editor.pending_highlighter_file is not None:
+            # Deferred to the event loop so a caller filling the new tab (e.g. open_file) finishes first;
+            # the highlighter is then attached once, to the loaded text, and Qt highlights it in a single pass.
+            # Tabs that are never shown never build a highlighter.
+            QTimer.singleShot(0, editor.apply_pending_highlighter)
+
+    def set_tab_modified(self, editor, modified):
+        """Adds/removes '*' to/from the editor's tab title to indicate modification."""
+        if editor.tab_modified_marker == modified:
+            return # Tab title already shows this state; no tab lookup or relayout needed
+        index = self.indexOf(editor) # Only looked up on an actual state change
+        if index < 0: return # Editor's tab was already closed
+        editor.tab_modified_marker = modified
+        self.setTabText(index, editor.tab_title + ("*" if modified else "")) # Cached title, no rstrip needed
         # Removed: self.widget(index).document().setModified(modified)
         # This is now managed by Qt's modificationChanged signal
         self.parent().setWindowModified(modified) # Update main window's modified status
 
+    def set_tab_title(self, editor, title):
+        """Sets the editor's tab title, keeping the '*' marker if it is shown."""
+        editor.tab_title = title
+        index = self.indexOf(editor)
+        if index >= 0:
+            self.setTabText(index, title + ("*" if editor.tab_modified_marker else ""))
+
     def close_tab(self, index):
         """Handles closing a tab, prompting to save if modified."""
         editor_to_close = self.widget(index)
@@ -230,7 +577,7 @@ class NoteTabWidget(QTabWidget):
             reply = QMessageBox.question(
                 self,
                 "Save Changes",
-                f"Do you want to save changes to {self.tabText(index).rstrip('*')}?",
+                f"Do you want to save changes to {editor_to_close.tab_title}?",
                 QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard | QMessageBox.StandardButton.Cancel
             )
             if reply == QMessageBox.StandardButton.Save:
@@ -248,6 +595,10 @@ class NoteTabWidget(QTabWidget):
         """Returns the TextEditor widget of the currently active tab."""
         return self.currentWidget()
 
+    def editors(self):
+        """Returns the TextEditor of every tab in tab order, looking each widget up only once."""
+        return [self.widget(i) for i in range(self.count())]
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -255,14 +606,35 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 800, 600)
 
         self.dark_mode_enabled = False
-        self.current_theme = "light" # "light" or "dark"
+        self.current_theme = None # "light" or "dark" once apply_theme has run
+        self.auto_save_dir = os.path.join(os.path.expanduser("~"), ".quicknote_autosave")
+        self.auto_save_signals = AutoSaveSignals(self)
+        self.auto_save_signals.saved.connect(self.show_auto_save_status)
+        # Auto-save jobs get their own single-thread pool: they never compete with other pool users
+        # for threads, and passes run in order, so an older snapshot can't land after a newer one.
+        self.auto_save_pool = QThreadPool(self)
+        self.auto_save_pool.setMaxThreadCount(1)
+        self.last_status = None # (name, modified, line, col) last shown by update_status_bar
+
+        # Status bar refresh is coalesced: a burst of cursor moves while typing triggers one update
+        self.status_bar_timer = QTimer(self)
+        self.status_bar_timer.setSingleShot(True)
+        self.status_bar_timer.setInterval(100)
+        self.status_bar_timer.timeout.connect(self.update_status_bar)
+        # Same for the formatting toolbar (see update_format_ui)
+        self.last_format_state = None # (bold, italic, underline, strike, family, size) last shown
+        self.format_ui_timer = QTimer(self)
+        self.format_ui_timer.setSingleShot(True)
+        self.format_ui_timer.setInterval(50)
+        self.format_ui_timer.timeout.connect(self.refresh_format_ui)
 
         self.setup_ui()
         self.apply_theme() # Apply initial theme
 
         # Auto-save timer
         self.auto_save_timer = QTimer(self)
-        self.auto_save_timer.setInterval(60000) # Auto-save every 60 seconds (1 minute)
+        # Auto-save every 60 seconds to start with; auto_save_all_tabs and note_edit_activity adapt it
+        self.auto_save_timer.setInterval(60000)
         self.auto_save_timer.timeout.connect(self.auto_save_all_tabs)
         self.auto_save_timer.start()
 
@@ -272,9 +644,8 @@ class MainWindow(QMainWindow):
         """Sets up the main window UI components."""
         self.tabs = NoteTabWidget(self)
         self.setCentralWidget(self.tabs)
-        # Wire signals for the initial tab
-        initial_editor = self.tabs.add_new_tab()
-        self.wire_editor_signals(initial_editor)
+        # add_new_tab wires the editor signals, including for this initial tab
+        self.tabs.add_new_tab()
 
         self.create_actions()
         self.create_menus()
@@ -285,13 +656,15 @@ class MainWindow(QMainWindow):
         # Connect current tab changed signal for status bar updates
         self.tabs.currentChanged.connect(self.update_status_bar_and_format_ui)
         # Initial update for format UI
-        self.update_format_ui(initial_editor.currentCharFormat())
+        self.update_format_ui()
 
 
     def wire_editor_signals(self, editor):
         """Connects signals from a TextEditor instance for UI updates."""
-        editor.cursorPositionChanged.connect(self.update_status_bar)
+        editor.cursorPositionChanged.connect(self.status_bar_timer.start) # Debounced update_status_bar
         editor.currentCharFormatChanged.connect(self.update_format_ui) # New: Connect for rich text UI update
+        # Only real edits bring a backed-off auto-save timer forward; textChanged also fires on loads and rehighlights
+        editor.document().undoCommandAdded.connect(self.note_edit_activity)
 
     def create_actions(self):
         """Creates QActions for menu and toolbar using standard key sequences and custom icon loader."""
@@ -325,32 +698,32 @@ class MainWindow(QMainWindow):
         self.undo_action = QAction(get_icon("undo"), "&Undo", self)
         self.undo_action.setShortcut(QKeySequence.Undo)
         self.undo_action.setStatusTip("Undo the last action")
-        self.undo_action.triggered.connect(lambda: self.tabs.current_editor().undo())
+        self.undo_action.triggered.connect(self.edit_undo)
 
         self.redo_action = QAction(get_icon("redo"), "&Redo", self)
         self.redo_action.setShortcut(QKeySequence.Redo)
         self.redo_action.setStatusTip("Redo the last action")
-        self.redo_action.triggered.connect(lambda: self.tabs.current_editor().redo())
+        self.redo_action.triggered.connect(self.edit_redo)
 
         self.cut_action = QAction(get_icon("cut"), "Cu&t", self)
         self.cut_action.setShortcut(QKeySequence.Cut)
         self.cut_action.setStatusTip("Cut selected text")
-        self.cut_action.triggered.connect(lambda: self.tabs.current_editor().cut())
+        self.cut_action.triggered.connect(self.edit_cut)
 
         self.copy_action = QAction(get_icon("copy"), "&Copy", self)
         self.copy_action.setShortcut(QKeySequence.Copy)
         self.copy_action.setStatusTip("Copy selected text")
-        self.copy_action.triggered.connect(lambda: self.tabs.current_editor().copy())
+        self.copy_action.triggered.connect(self.edit_copy)
 
         self.paste_action = QAction(get_icon("paste"), "&Paste", self)
         self.paste_action.setShortcut(QKeySequence.Paste)
         self.paste_action.setStatusTip("Paste text from clipboard")
-        self.paste_action.triggered.connect(lambda: self.tabs.current_editor().paste())
+        self.paste_action.triggered.connect(self.edit_paste)
 
         self.select_all_action = QAction("Select &All", self)
         self.select_all_action.setShortcut(QKeySequence.SelectAll)
         self.select_all_action.setStatusTip("Select all text")
-        self.select_all_action.triggered.connect(lambda: self.tabs.current_editor().selectAll())
+        self.select_all_action.triggered.connect(self.edit_select_all)
 
         self.search_action = QAction(get_icon("search"), "&Search/Replace", self)
         self.search_action.setShortcut(QKeySequence.Find) # Using standard Find shortcut
@@ -392,6 +765,31 @@ class MainWindow(QMainWindow):
         self.strike_action.setCheckable(True)
         self.strike_action.toggled.connect(self.toggle_strike)
 
+    # Edit action slots: forward to the current editor, if there is one
+    def edit_undo(self):
+        ed = self.tabs.current_editor()
+        if ed: ed.undo()
+
+    def edit_redo(self):
+        ed = self.tabs.current_editor()
+        if ed: ed.redo()
+
+    def edit_cut(self):
+        ed = self.tabs.current_editor()
+        if ed: ed.cut()
+
+    def edit_copy(self):
+        ed = self.tabs.current_editor()
+        if ed: ed.copy()
+
+    def edit_paste(self):
+        ed = self.tabs.current_editor()
+        if ed: ed.paste()
+
+    def edit_select_all(self):
+        ed = self.tabs.current_editor()
+        if ed: ed.selectAll()
+
 
     def create_menus(self):
         """Creates the application's menu bar."""
@@ -484,13 +882,13 @@ class MainWindow(QMainWindow):
     def update_status_bar_and_format_ui(self):
         """Updates both the status bar and the formatting toolbar UI."""
         self.update_status_bar()
-        editor = self.tabs.current_editor()
-        if editor:
-            self.update_format_ui(editor.currentCharFormat())
-        else:
-            # Reset format UI if no editor is active
-            self.update_format_ui(QTextCharFormat())
+        self.update_format_ui() # Resets the format UI if no editor is active
+
 
+    def flush_status_bar(self):
+        """Runs a pending debounced status bar update now, before a message is shown over it."""
+        self.status_bar_timer.stop()
+        self.update_status_bar()
 
     def update_status_bar(self):
         """
@@ -502,17 +900,23 @@ class MainWindow(QMainWindow):
             file_path = editor.current_file_path
             display_name = os.path.basename(file_path) if file_path else "Untitled"
             is_modified = editor.document().isModified()
+            cursor = editor.textCursor()
+            line = cursor.blockNumber() + 1
+            col = cursor.columnNumber() + 1
+            # Skip the title/status rebuild when nothing shown has changed
+            status = (display_name, is_modified, line, col)
+            if status == self.last_status:
+                return
+            self.last_status = status
 
             # Update window title and modified dot
             self.setWindowTitle(f"Quicknote - {display_name}{'*' if is_modified else ''}")
             self.setWindowModified(is_modified) # For OS-native dirty indicator
 
-            cursor = editor.textCursor()
-            line = cursor.blockNumber() + 1
-            col = cursor.columnNumber() + 1
             status_text = f"{display_name}{' (Modified)' if is_modified else ''} | Line: {line}, Col: {col}"
             self.status_bar.showMessage(status_text)
         else:
+            self.last_status = None
             self.setWindowTitle("Quicknote")
             self.setWindowModified(False)
             self.status_bar.showMessage("Ready")
@@ -543,20 +947,21 @@ class MainWindow(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(self, "Open Note", "", file_filters)
         if file_path:
             try:
-                is_html = file_path.lower().endswith((".html", ".htm"))
+                # Strict UTF-8: a file in another encoding raises UnicodeDecodeError and is reported below,
+                # instead of opening with replacement characters that the next save would write back.
+                # Not QFile/QTextStream: the stream substitutes invalid bytes without reporting an error,
+                # and PySide6's QStringDecoder has no call that decodes a buffer.
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
 
                 editor = self.tabs.add_new_tab(file_path) # Add tab first to get editor instance
-                if is_html:
+                if editor.is_html_file:
                     editor.setHtml(content)
                     editor.rich_mode = True
                 else:
                     editor.setPlainText(content)
                     editor.rich_mode = False # Ensure plain text mode for code files
-                
-                # Re-apply syntax highlighter based on rich_mode or file_path
-                editor.set_syntax_highlighter(file_path, self.dark_mode_enabled)
+                # The syntax highlighter is attached by the tab widget once this tab is shown
 
                 editor.document().setModified(False) # File is not modified right after opening
                 self.update_status_bar_and_format_ui() # Update status bar and format UI
@@ -592,13 +997,22 @@ class MainWindow(QMainWindow):
 
         try:
             # Determine content to save: HTML if rich_mode or HTML extension, else plain text
-            is_html_extension = file_path.lower().endswith((".html", ".htm"))
-            if editor.rich_mode or is_html_extension:
-                data = editor.document().toHtml().encode("utf-8")
+            is_html_extension = editor.is_html_file
+            if is_html_extension and not editor.has_formatting():
+                # Nothing for toHtml() to preserve: skip its per-fragment style serialization
+                text = plain_text_to_html(editor.toPlainText())
+            elif editor.rich_mode or is_html_extension:
+                text = editor.document().toHtml()
             else:
-                data = editor.toPlainText().encode("utf-8")
-            
-            save_file_obj.write(data)
+                text = editor.toPlainText()
+
+            # QTextStream encodes into the save file's buffer in chunks; no full-size bytes copy in Python
+            stream = QTextStream(save_file_obj)
+            stream.setEncoding(QStringConverter.Encoding.Utf8)
+            stream << text
+            stream.flush()
+            if stream.status() != QTextStream.Status.Ok:
+                raise OSError(save_file_obj.errorString())
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Error writing to file '{file_path}':\n{e}")
             save_file_obj.cancelWriting() # Discard partial write
@@ -609,11 +1023,11 @@ class MainWindow(QMainWindow):
             return False
 
         editor.document().setModified(False) # Qt's own tracking, not forced
-        self.tabs.set_tab_modified(self.tabs.indexOf(editor), False)
+        self.tabs.set_tab_modified(editor, False)
         self.status_bar.showMessage(f"Saved {os.path.basename(file_path)}", 3000) # Message for 3 seconds
         self.update_status_bar_and_format_ui() # Update window title etc. and format UI
         # Delete auto-saved temporary file after successful real save
-        self.cleanup_auto_save_file(file_path)
+        self.cleanup_auto_save_file(editor)
         return True
 
     def save_file_as(self, editor=None):
@@ -654,8 +1068,8 @@ class MainWindow(QMainWindow):
                  QMessageBox.information(self, "Warning", "Saving as .docx is not supported. The file will be saved as plain text with a .docx extension.")
 
 
-            # Confirmation for overwrite belongs only in Save As
-            if QFileInfo(file_path).exists():
+            # Confirmation for overwrite belongs only in Save As; re-saving to the note's own file needs none
+            if file_path != editor.current_file_path and os.path.exists(file_path):
                 reply = QMessageBox.question(
                     self, "Confirm Overwrite",
                     f"The file '{os.path.basename(file_path)}' already exists. Do you want to overwrite it?",
@@ -666,7 +1080,7 @@ class MainWindow(QMainWindow):
 
             editor.current_file_path = file_path
             editor.set_syntax_highlighter(file_path, self.dark_mode_enabled) # Update highlighter for new extension
-            self.tabs.setTabText(self.tabs.indexOf(editor), os.path.basename(file_path)) # Update tab name
+            self.tabs.set_tab_title(editor, os.path.basename(file_path)) # Update tab name
             return self.save_file(editor=editor) # Now save to the new path (which will use QSaveFile)
         return False
 
@@ -677,55 +1091,27 @@ class MainWindow(QMainWindow):
 
     def apply_theme(self):
         """Applies the selected theme to the application."""
+        theme = "dark" if self.dark_mode_enabled else "light"
+        if theme == self.current_theme:
+            return # Already applied: skip the palette and stylesheet re-polish of every widget
+        self.current_theme = theme
         app = QApplication.instance()
 
         if self.dark_mode_enabled:
-            # Dark mode palette (Dracula-like)
-            palette = QPalette()
-            palette.setColor(QPalette.Window, QColor("#282c34")) # Background
-            palette.setColor(QPalette.WindowText, QColor("#abb2bf")) # General Text
-            palette.setColor(QPalette.Base, QColor("#21252b")) # TextEdit background
-            palette.setColor(QPalette.AlternateBase, QColor("#3e4452"))
-            palette.setColor(QPalette.ToolTipBase, QColor("#282c34"))
-            palette.setColor(QPalette.ToolTipText, QColor("#abb2bf"))
-            palette.setColor(QPalette.Text, QColor("#abb2bf")) # Foreground
-            palette.setColor(QPalette.Button, QColor("#3e4452")) # Button background
-            palette.setColor(QPalette.ButtonText, QColor("#abb2bf")) # Button text
-            palette.setColor(QPalette.BrightText, Qt.red)
-            palette.setColor(QPalette.Link, QColor("#61afef")) # Link color
-            palette.setColor(QPalette.Highlight, QColor("#61afef")) # Selection highlight
-            palette.setColor(QPalette.HighlightedText, QColor("#282c34")) # Selected text color
-            app.setPalette(palette)
-            self.setStyleSheet("""
-                QMainWindow { background-color: #282c34; }
-                QMenuBar { background-color: #21252b; color: #abb2bf; }
-                QMenuBar::item:selected { background-color: #3e4452; }
-                QMenu { background-color: #21252b; color: #abb2bf; border: 1px solid #3e4452; }
-                QMenu::item:selected { background-color: #3e4452; }
-                QToolBar { background-color: #21252b; border-bottom: 1px solid #3e4452; }
-                QStatusBar { background-color: #21252b; color: #abb2bf; border-top: 1px solid #3e4452; }
-                QTabWidget::pane { border: 1px solid #3e4452; }
-                QTabBar::tab { background: #3e4452; color: #abb2bf; border: 1px solid #3e4452; border-bottom-color: #282c34; border-radius: 5px 5px 0 0; padding: 5px; margin: 2px;}
-                QTabBar::tab:selected { background: #282c34; border-bottom-color: #282c34; }
-                QTextEdit { background-color: #21252b; color: #abb2bf; border: 1px solid #3e4452; border-radius: 8px; padding: 5px; }
-            """)
-            if hasattr(self, "toolbar"):
-                self.toolbar.setToolButtonStyle(Qt.ToolButtonTextBesideIcon) # Set to text beside icon
-                self.toolbar.setStyleSheet("") # Inherit style from QMainWindow QSS
+            app.setPalette(_dark_palette()) # Built once, on the first switch to dark mode
+            self.setStyleSheet(DARK_QSS)
         else:
             # Light mode palette (reset to default system palette)
-            app.setPalette(app.style().standardPalette())
+            app.setPalette(_light_palette())
             self.setStyleSheet("") # Clear custom stylesheet for main window
-            self.tabs.setStyleSheet("QTabWidget::pane { border: 0; } QTabBar::tab { border-radius: 5px 5px 0 0; padding: 5px; margin: 2px;} QTabBar::tab:selected { background: #e0e0e0; }")
-            if hasattr(self, "toolbar"):
-                self.toolbar.setToolButtonStyle(Qt.ToolButtonTextBesideIcon) # Set to text beside icon
-                self.toolbar.setStyleSheet("") # Inherit style from QMainWindow QSS (native look)
+            self.tabs.setStyleSheet(LIGHT_TABS_QSS)
+        if hasattr(self, "toolbar"):
+            self.toolbar.setToolButtonStyle(Qt.ToolButtonTextBesideIcon) # Set to text beside icon
+            self.toolbar.setStyleSheet("") # Inherit style from QMainWindow QSS
 
         # Apply dark mode setting to all existing TextEditor instances (which will re-apply highlighters)
-        for i in range(self.tabs.count()):
-            editor = self.tabs.widget(i)
-            if isinstance(editor, TextEditor):
-                editor.set_dark_mode(self.dark_mode_enabled)
+        for editor in self.tabs.editors():
+            editor.set_dark_mode(self.dark_mode_enabled)
 
     # New: Formatting Helper Functions
     def apply_char_format(self, fmt: QTextCharFormat):
@@ -736,14 +1122,15 @@ class MainWindow(QMainWindow):
             cursor.mergeCharFormat(fmt)
             ed.setTextCursor(cursor) # Apply changes
         ed.mergeCurrentCharFormat(fmt)  # affects future typing
-        ed.rich_mode = True  # mark as rich once any format applied
-        # Re-apply syntax highlighter based on rich_mode
-        ed.set_syntax_highlighter(ed.current_file_path or "", self.dark_mode_enabled)
+        if not ed.rich_mode:
+            ed.rich_mode = True  # mark as rich once any format applied
+            # Re-apply syntax highlighter based on rich_mode; only this transition can change it
+            ed.set_syntax_highlighter(ed.current_file_path or "", self.dark_mode_enabled)
 
 
     def toggle_bold(self, checked):
         fmt = QTextCharFormat()
-        fmt.setFontWeight(QFont.Weight.Bold if checked else QFont.Weight.Normal)
+        fmt.setFontWeight(FONT_WEIGHT_BOLD if checked else FONT_WEIGHT_NORMAL)
         self.apply_char_format(fmt)
 
     def toggle_italic(self, checked):
@@ -775,43 +1162,52 @@ class MainWindow(QMainWindow):
         fmt.setFontPointSize(pts)
         self.apply_char_format(fmt)
 
-    def update_format_ui(self, fmt: QTextCharFormat):
-        """Updates the formatting toolbar buttons/comboboxes to reflect the current format."""
-        # Block signals to prevent feedback loops when setting UI states
-        self.bold_action.blockSignals(True)
-        self.bold_action.setChecked(fmt.fontWeight() >= QFont.Bold)
-        self.bold_action.blockSignals(False)
-
-        self.italic_action.blockSignals(True)
-        self.italic_action.setChecked(fmt.fontItalic())
-        self.italic_action.blockSignals(False)
-
-        self.underline_action.blockSignals(True)
-        self.underline_action.setChecked(fmt.fontUnderline())
-        self.underline_action.blockSignals(False)
-
-        self.strike_action.blockSignals(True)
-        self.strike_action.setChecked(fmt.fontStrikeOut())
-        self.strike_action.blockSignals(False)
-
-        self.font_box.blockSignals(True)
-        self.font_box.setCurrentFont(fmt.font())
-        self.font_box.blockSignals(False)
-
-        if fmt.fontPointSize() > 0: # Only set if a valid point size exists
-            self.size_box.blockSignals(True)
-            # Find the index of the point size in the combobox, if it exists
-            idx = self.size_box.findText(str(int(fmt.fontPointSize())))
-            if idx != -1:
-                self.size_box.setCurrentIndex(idx)
-            else: # If not in list, add it or just set text
-                self.size_box.setEditText(str(int(fmt.fontPointSize())))
-            self.size_box.blockSignals(False)
-        else:
-            # Optionally clear the size box or set to a default if no size is found
-            self.size_box.blockSignals(True)
-            self.size_box.setCurrentText("") # Or a default like "12"
-            self.size_box.blockSignals(False)
+    def update_format_ui(self, fmt=None):
+        """
+        Schedules a refresh of the formatting toolbar. Slot for currentCharFormatChanged;
+        a burst of format changes (cursor moves, typing) results in one refresh_format_ui call.
+        """
+        self.format_ui_timer.start()
+
+    def refresh_format_ui(self):
+        """Updates the formatting toolbar buttons/comboboxes to reflect the current editor's format."""
+        editor = self.tabs.current_editor()
+        fmt = editor.currentCharFormat() if editor else QTextCharFormat() # Read at fire time, not a stale copy
+        font = fmt.font()
+        state = (fmt.fontWeight() >= FONT_WEIGHT_BOLD, fmt.fontItalic(), fmt.fontUnderline(),
+                 fmt.fontStrikeOut(), font.family(), fmt.fontPointSize())
+        if state == self.last_format_state:
+            return # Toolbar already shows this format; skip the font combo lookup
+        self.last_format_state = state
+
+        bold, italic, underline, strike, _, point_size = state
+
+        # Block signals to prevent feedback loops when setting UI states.
+        # One QSignalBlocker per widget, all released together even if a setter raises.
+        blockers = [QSignalBlocker(widget) for widget in (
+            self.bold_action, self.italic_action, self.underline_action, self.strike_action,
+            self.font_box, self.size_box
+        )]
+        try:
+            self.bold_action.setChecked(bold)
+            self.italic_action.setChecked(italic)
+            self.underline_action.setChecked(underline)
+            self.strike_action.setChecked(strike)
+            self.font_box.setCurrentFont(font)
+
+            if point_size > 0: # Only set if a valid point size exists
+                # Find the index of the point size in the combobox, if it exists
+                idx = self.size_box.findText(str(int(point_size)))
+                if idx != -1:
+                    self.size_box.setCurrentIndex(idx)
+                else: # If not in list, add it or just set text
+                    self.size_box.setEditText(str(int(point_size)))
+            else:
+                # Optionally clear the size box or set to a default if no size is found
+                self.size_box.setCurrentText("") # Or a default like "12"
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
 
 
     def show_search_dialog(self):
@@ -823,19 +1219,19 @@ class MainWindow(QMainWindow):
 
         search_text, ok = QInputDialog.getText(self, "Search", "Enter text to find:")
         if ok and search_text:
-            cursor = editor.textCursor()
-            # Start search from current cursor position, or from start if not found
-            found = editor.find(search_text, QTextDocument.FindFlags(0))
-            if not found:
-                # If not found from current position, try from beginning
-                cursor.setPosition(0)
-                editor.setTextCursor(cursor)
-                found = editor.find(search_text, QTextDocument.FindFlags(0))
-
-            if not found:
+            doc = editor.document()
+            # Start search from current cursor position (after any selection, so repeats find the next match).
+            # On a miss, wrap around with one more search from the start; the cursor is moved only on a hit.
+            cursor = doc.find(search_text, editor.textCursor())
+            if cursor.isNull():
+                cursor = doc.find(search_text, 0)
+
+            if cursor.isNull():
                 QMessageBox.information(self, "Search", f"'{search_text}' not found.")
-            else:
-                self.status_bar.showMessage(f"Found '{search_text}'")
+                return # Nothing selected to replace
+            editor.setTextCursor(cursor) # Select the match
+            self.flush_status_bar() # Otherwise the debounced update overwrites the message below
+            self.status_bar.showMessage(f"Found '{search_text}'")
 
             # Basic Replace (could be extended to a full dialog)
             replace_reply = QMessageBox.question(self, "Replace", f"Replace '{search_text}'?",
@@ -843,7 +1239,8 @@ class MainWindow(QMainWindow):
             if replace_reply == QMessageBox.StandardButton.Yes:
                 replace_text, ok_replace = QInputDialog.getText(self, "Replace", f"Replace '{search_text}' with:")
                 if ok_replace:
-                    cursor.insertText(replace_text)
+                    cursor.insertText(replace_text) # Replaces the selected match
+                    self.flush_status_bar()
                     self.status_bar.showMessage(f"Replaced '{search_text}' with '{replace_text}'")
 
     def show_about_dialog(self):
@@ -900,57 +1297,102 @@ class MainWindow(QMainWindow):
             "<li><b>Dark Mode (F10):</b> Toggle between light and dark themes for comfortable viewing.</li>"
             "</ul>"
             "<h3>Auto-Save:</h3>"
-            "<p>Your notes are automatically saved to a temporary location every minute. If QuickNote closes unexpectedly, you may be prompted to restore these auto-saved files on next launch. Auto-saved files will preserve rich text formatting if any has been applied.</p>"
+            "<p>Your notes are automatically saved to a temporary location every 30 seconds while you edit, and less often (up to every 3 minutes) while they sit idle. If QuickNote closes unexpectedly, you may be prompted to restore these auto-saved files on next launch. Auto-saved files will preserve rich text formatting if any has been applied.</p>"
         )
         QMessageBox.information(self, "How to Use QuickNote", how_to_use_text)
 
 
-    def get_auto_save_path(self, original_file_path):
-        """Generates a stable auto-save path based on original file path or a unique ID."""
-        auto_save_dir = os.path.join(os.path.expanduser("~"), ".quicknote_autosave")
-        os.makedirs(auto_save_dir, exist_ok=True)
+    def get_auto_save_path(self, original_file_path, auto_save_id=None):
+        """Generates a stable auto-save path based on original file path or the tab's auto-save ID."""
         if original_file_path:
             # Use a hash of the absolute path for a stable temp name
+            import hashlib # Imported on first use; untitled notes never need it
             hash_object = hashlib.sha256(original_file_path.encode())
-            return os.path.join(auto_save_dir, f"{hash_object.hexdigest()}.tmp")
+            return os.path.join(self.auto_save_dir, f"{hash_object.hexdigest()}.tmp")
         else:
-            # For "Untitled" files, generate a random ID
-            return os.path.join(auto_save_dir, f"untitled_{os.urandom(8).hex()}.tmp")
+            # For "Untitled" files, use the ID assigned to the tab so each pass overwrites the same file
+            return os.path.join(self.auto_save_dir, f"untitled_{auto_save_id}.tmp")
 
     def auto_save_all_tabs(self):
-        """Auto-saves all modified tabs to a temporary directory using stable paths."""
-        for i in range(self.tabs.count()):
-            editor = self.tabs.widget(i)
-            if isinstance(editor, TextEditor) and editor.document().isModified():
-                temp_file_path = self.get_auto_save_path(editor.current_file_path)
-                try:
-                    # Save as HTML if rich_mode is enabled, otherwise plain text
-                    data_to_save = editor.document().toHtml() if editor.rich_mode else editor.toPlainText()
-                    with open(temp_file_path, 'w', encoding='utf-8') as f:
-                        f.write(data_to_save)
-                    self.status_bar.showMessage(f"Auto-saved: {os.path.basename(editor.current_file_path or 'Untitled')}", 2000)
-                except Exception as e:
-                    print(f"Error auto-saving tab {i} ('{editor.current_file_path or 'Untitled'}'): {e}")
-
-    def cleanup_auto_save_file(self, original_file_path):
-        """Deletes the auto-saved temporary file associated with a successfully saved original file."""
-        if original_file_path:
-            temp_file_path = self.get_auto_save_path(original_file_path)
-            if os.path.exists(temp_file_path):
-                try:
-                    os.remove(temp_file_path)
-                    print(f"Cleaned up auto-save for: {original_file_path}")
-                except Exception as e:
-                    print(f"Error cleaning up auto-save file '{temp_file_path}': {e}")
+        """
+        Auto-saves all modified tabs to a temporary directory using stable paths.
+        Text is snapshotted here on the GUI thread; the files are written by an AutoSaveJob.
+        """
+        snapshots = []
+        for editor in self.tabs.editors():
+            document = editor.document()
+            if not document.isModified():
+                continue # Clean tab: nothing to save
+            revision = document.revision()
+            if revision == editor.last_auto_save_revision:
+                continue # Unchanged since the last successful auto-save; skip serializing and hashing the text
+            if editor.auto_save_path is None: # Hashed once per file path, not on every pass
+                editor.auto_save_path = self.get_auto_save_path(editor.current_file_path, editor.auto_save_id)
+            temp_file_path = editor.auto_save_path
+            display_name = os.path.basename(editor.current_file_path or 'Untitled')
+            # Save as HTML if rich_mode is enabled, otherwise plain text
+            data_to_save = document.toHtml() if editor.rich_mode else editor.toPlainText()
+            # Skip the write if the content is the same as last time (e.g. edited and then undone)
+            content_hash = hash(data_to_save)
+            if content_hash == editor.last_auto_save_hash:
+                editor.last_auto_save_revision = revision # This text is already on disk
+                continue
+            # The note may have auto-saved under another name before (e.g. a Save As whose write failed)
+            old_file_paths = sorted(editor.auto_save_targets - {temp_file_path})
+            editor.auto_save_targets.add(temp_file_path)
+            # Recorded on the editor by show_auto_save_status only after the write succeeds,
+            # so a failed write is retried on the next pass
+            record = (editor.auto_save_id, editor.auto_save_generation, content_hash, revision, temp_file_path)
+            snapshots.append((temp_file_path, display_name, data_to_save, record, old_file_paths))
+        if not snapshots:
+            # Nothing to save: no I/O at all on an idle tick, and wait twice as long for the next one
+            self.auto_save_timer.setInterval(min(self.auto_save_timer.interval() * 2, AUTO_SAVE_MAX_INTERVAL))
+            return
+        self.auto_save_timer.setInterval(AUTO_SAVE_ACTIVE_INTERVAL) # Notes are being edited: save often
+        self.auto_save_pool.start(AutoSaveJob(self.auto_save_dir, snapshots, self.auto_save_signals))
+
+    def note_edit_activity(self):
+        """Slot for undoCommandAdded: restores the short auto-save interval once editing resumes."""
+        if self.auto_save_timer.interval() != AUTO_SAVE_ACTIVE_INTERVAL:
+            self.auto_save_timer.start(AUTO_SAVE_ACTIVE_INTERVAL) # Restarts the countdown from now
+
+    def show_auto_save_status(self, display_name, record):
+        """
+        Records a finished auto-save on its editor and reports it in the status bar (called on the GUI thread).
+        """
+        auto_save_id, generation, content_hash, revision, temp_file_path = record
+        for editor in self.tabs.editors():
+            if editor.auto_save_id == auto_save_id:
+                if editor.auto_save_generation == generation: # No real save since the snapshot was taken
+                    editor.last_auto_save_hash = content_hash
+                    editor.last_auto_save_revision = revision
+                    editor.auto_save_targets = {temp_file_path} # The job removed the older ones
+                break
+        self.status_bar.showMessage(f"Auto-saved: {display_name}", 2000)
+
+    def cleanup_auto_save_file(self, editor):
+        """Deletes the auto-saved temporary files of an editor whose note was just saved successfully."""
+        # The files this editor actually auto-saved to (e.g. untitled_<id>.tmp before a Save As),
+        # plus the one named after its file path, which an earlier session may have left behind
+        temp_file_paths = editor.auto_save_targets | {self.get_auto_save_path(editor.current_file_path)}
+        editor.auto_save_targets = set()
+        # No auto-save exists any more: the next edit must be written even if it matches an earlier one
+        editor.last_auto_save_hash = None
+        editor.last_auto_save_revision = None
+        editor.auto_save_generation += 1
+        # Queued behind any pending AutoSaveJob, which could otherwise recreate the file afterwards
+        self.auto_save_pool.start(RemoveAutoSaveJob(sorted(temp_file_paths)))
 
 
     def load_auto_saved_files(self):
         """Loads auto-saved files when the application starts."""
-        auto_save_dir = os.path.join(os.path.expanduser("~"), ".quicknote_autosave")
+        auto_save_dir = self.auto_save_dir
         if not os.path.exists(auto_save_dir):
             return
 
-        auto_saved_files = [f for f in os.listdir(auto_save_dir) if f.endswith(".tmp")]
+        # scandir yields each entry's type from the directory listing itself; no extra stat per file
+        with os.scandir(auto_save_dir) as entries:
+            auto_saved_files = [e for e in entries if e.name.endswith(".tmp") and e.is_file()]
         if auto_saved_files:
             reply = QMessageBox.question(
                 self,
@@ -959,25 +1401,42 @@ class MainWindow(QMainWindow):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
             if reply == QMessageBox.StandardButton.Yes:
-                for temp_file_name in auto_saved_files:
-                    temp_file_path = os.path.join(auto_save_dir, temp_file_name)
+                # Read all files concurrently so restore waits for the slowest read, not the sum of them.
+                # Tabs are still created below, on the GUI thread.
+                # Imported here, not at startup: concurrent.futures (and logging) only matter for a restore
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    results = list(executor.map(read_auto_save_file, (e.path for e in auto_saved_files)))
+                for entry, (content, is_html, error) in zip(auto_saved_files, results):
+                    temp_file_name = entry.name
+                    if error is not None:
+                        print(f"Error loading auto-saved file {temp_file_name}: {error}")
+                        continue
                     try:
-                        with open(temp_file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        
-                        # Add as a new untitled tab
-                        editor = self.tabs.add_new_tab(content=content)
-                        # Determine if the auto-saved content was rich text (heuristic: check for common HTML tags)
-                        # A more robust check might be needed for production if HTML is very sparse
-                        if "<html" in content.lower() and "<body" in content.lower():
-                            editor.setHtml(content)
-                            editor.rich_mode = True
-                            self.tabs.setTabText(self.tabs.currentIndex(), f"Restored (HTML): {temp_file_name}")
-                        else:
-                            editor.setPlainText(content)
-                            editor.rich_mode = False
-                            self.tabs.setTabText(self.tabs.currentIndex(), f"Restored: {temp_file_name}")
-                        
+                        # Add as a new untitled tab; the content is set once below, in the right mode
+                        editor = self.tabs.add_new_tab()
+                        # Adopt the source file: later auto-saves overwrite it and a real save deletes it,
+                        # instead of a new copy under a fresh ID piling up on every launch
+                        editor.auto_save_path = entry.path
+                        editor.auto_save_targets = {entry.path}
+                        # No repaints while the content is set: one layout and paint once it is loaded.
+                        # The document's own signals stay live; its layout, undo state and the tab's
+                        # modified marker depend on them.
+                        editor.setUpdatesEnabled(False)
+                        try:
+                            # Determine if the auto-saved content was rich text (heuristic in read_auto_save_file)
+                            # A more robust check might be needed for production if HTML is very sparse
+                            if is_html:
+                                editor.setHtml(content)
+                                editor.rich_mode = True
+                                self.tabs.set_tab_title(editor, f"Restored (HTML): {temp_file_name}")
+                            else:
+                                editor.setPlainText(content)
+                                editor.rich_mode = False
+                                self.tabs.set_tab_title(editor, f"Restored: {temp_file_name}")
+                        finally:
+                            editor.setUpdatesEnabled(True) # Schedules the single repaint
+
                         editor.document().setModified(True) # Treat as modified until saved
                     except Exception as e:
                         print(f"Error loading auto-saved file {temp_file_name}: {e}")
@@ -987,28 +1446,70 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Overrides close event to prompt user to save modified files."""
-        # Iterate over all tabs to check for unsaved changes
-        for i in range(self.tabs.count()):
-            editor = self.tabs.widget(i)
-            if editor.document().isModified():
-                self.tabs.setCurrentIndex(i) # Bring the unsaved tab to front
-                reply = QMessageBox.question(
-                    self,
-                    "Unsaved Changes",
-                    f"The document '{self.tabs.tabText(i).rstrip('*')}' has unsaved changes. Do you want to save it before closing?",
-                    QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard | QMessageBox.StandardButton.Cancel
-                )
-                if reply == QMessageBox.StandardButton.Save:
-                    # Pass the specific editor to be saved
-                    if not self.save_file(editor=editor):
-                        event.ignore()
-                        return
-                elif reply == QMessageBox.StandardButton.Cancel:
+        # Collect the tabs with unsaved changes once
+        modified = [editor for editor in self.tabs.editors() if editor.document().isModified()]
+        if len(modified) > 1:
+            # Several unsaved documents: one dialog to save or discard them all, or review them one by one
+            box = QMessageBox(
+                QMessageBox.Icon.Question,
+                "Unsaved Changes",
+                f"{len(modified)} documents have unsaved changes. Do you want to save them before closing?",
+                QMessageBox.StandardButton.SaveAll | QMessageBox.StandardButton.Discard | QMessageBox.StandardButton.Cancel,
+                self
+            )
+            review_button = box.addButton("Review Each...", QMessageBox.ButtonRole.ActionRole)
+            box.exec()
+            if box.clickedButton() is not review_button:
+                reply = box.standardButton(box.clickedButton())
+                if reply == QMessageBox.StandardButton.SaveAll:
+                    for editor in modified:
+                        self.tabs.setCurrentWidget(editor) # Show the note before a possible Save As prompt
+                        if not self.save_file(editor=editor): # Prompts for a name if untitled
+                            event.ignore()
+                            return
+                    event.accept()
+                elif reply == QMessageBox.StandardButton.Discard:
+                    event.accept()
+                else:
+                    event.ignore() # Cancel (or the dialog was closed)
+                return
+        # Ask about each unsaved tab in turn
+        for editor in modified:
+            self.tabs.setCurrentWidget(editor) # Bring the unsaved tab to front
+            reply = QMessageBox.question(
+                self,
+                "Unsaved Changes",
+                f"The document '{editor.tab_title}' has unsaved changes. Do you want to save it before closing?",
+                QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard | QMessageBox.StandardButton.Cancel
+            )
+            if reply == QMessageBox.StandardButton.Save:
+                # Pass the specific editor to be saved
+                if not self.save_file(editor=editor):
                     event.ignore()
                     return
+            elif reply == QMessageBox.StandardButton.Cancel:
+                event.ignore()
+                return
         # If all tabs are handled or no unsaved changes, accept close event
         event.accept()
 
+# Create a simple SVG icon placeholder with neutral stroke/fill for better contrast
+# Note: For 'bold', 'italic', 'underline', 'strikethrough', these are very basic placeholders.
+# Professional icons would be needed for a final product.
+ICON_SVG_TEMPLATE = """
+<svg width="24" height="24" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
+<rect x="2" y="2" width="20" height="20" rx="4" stroke="#9aa0a6" stroke-width="2"/>
+<text x="12" y="16" font-family="Arial" font-size="12" font-weight="{weight}" text-anchor="middle" fill="#9aa0a6">{char}</text>
+</svg>
+"""
+# (letter, font-weight) for icons that don't use their name's first letter
+ICON_CHARS = {
+    "bold": ("B", "bold"),
+    "italic": ("I", "normal"),
+    "underline": ("U", "normal"),
+    "strikethrough": ("S", "normal"),
+}
+
 # Create dummy icon files (for demonstration, in a real app these would be proper SVG/PNGs)
 # In a real PySide app, you'd use Qt resource files (.qrc) for icons, compiled with pyside6-rcc.
 # For this MVP, we create them on disk.
@@ -1017,25 +1518,15 @@ def create_dummy_icons():
     os.makedirs(icons_dir, exist_ok=True)
     icon_names = ["new", "open", "save", "save_as", "exit", "undo", "redo", "cut", "copy", "paste", "search",
                   "bold", "italic", "underline", "strikethrough"] # Added new icons
+    with os.scandir(icons_dir) as entries:
+        existing = {e.name for e in entries} # One directory read instead of a stat per icon
     for name in icon_names:
-        # Create a simple SVG icon placeholder with neutral stroke/fill for better contrast
-        # Note: For 'bold', 'italic', 'underline', 'strikethrough', these are very basic placeholders.
-        # Professional icons would be needed for a final product.
-        text_char = ""
-        if name == "bold": text_char = "B"
-        elif name == "italic": text_char = "I"
-        elif name == "underline": text_char = "U"
-        elif name == "strikethrough": text_char = "S"
-        else: text_char = name[0].upper() # Fallback for other icons
-
-        svg_content = f"""
-        <svg width="24" height="24" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
-        <rect x="2" y="2" width="20" height="20" rx="4" stroke="#9aa0a6" stroke-width="2"/>
-        <text x="12" y="16" font-family="Arial" font-size="12" font-weight="{ 'bold' if name == 'bold' else 'normal' }" text-anchor="middle" fill="#9aa0a6">{text_char}</text>
-        </svg>
-        """
+        if f"{name}.svg" in existing:
+            continue # Keep existing (shipped or previously generated) icons; no write on warm starts
+        # Fallback for other icons: first letter, normal weight
+        text_char, weight = ICON_CHARS.get(name, (name[0].upper(), "normal"))
         with open(os.path.join(icons_dir, f"{name}.svg"), "w") as f:
-            f.write(svg_content)
+            f.write(ICON_SVG_TEMPLATE.format(char=text_char, weight=weight))
 
 
 if __name__ == "__main__":